@@ -1,18 +1,26 @@
 from datetime import datetime, timezone
-from fastapi import FastAPI, Query
+from typing import Optional
+from fastapi import FastAPI, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from models import (
     MetricsResponse,
     LogsResponse,
     generate_time_series,
     generate_logs,
+    time_series_cache_info,
 )
 
 SERVICE_NAME = "payment-api"
 ENV_NAME = "prod"
 
-app = FastAPI(title="Synthetic Observability API", version="0.1.0")
+app = FastAPI(
+    title="Synthetic Observability API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,6 +29,19 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison: any listed tag, or ``*``, matches."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return True
+    return False
 
 
 @app.get("/health")
@@ -28,26 +49,58 @@ def health():
     return {"status": "ok", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
-@app.get("/metrics", response_model=MetricsResponse)
+@app.get(
+    "/metrics",
+    response_model=None,
+    responses={200: {"model": MetricsResponse}},
+)
 def get_metrics(
+    request: Request,
     window_minutes: int = Query(60, ge=5, le=24 * 60),
 ):
-    """Synthetic metrics for a single service (payment-api)."""
+    """Synthetic metrics for a single service (payment-api).
+
+    The series only changes when the minute rolls over, so clients may cache
+    it until then and revalidate with the minute-scoped ETag.
+    """
     now = datetime.now(timezone.utc)
-    points = generate_time_series(now=now, window_minutes=window_minutes)
-    return MetricsResponse(
-        service=SERVICE_NAME,
-        env=ENV_NAME,
-        window_minutes=window_minutes,
-        points=points,
+    headers = {
+        "ETag": f'W/"{int(now.timestamp()) // 60}-{window_minutes}"',
+        "Cache-Control": f"public, max-age={60 - now.second}",
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    series = generate_time_series(now=now, window_minutes=window_minutes)
+    return ORJSONResponse(
+        {
+            "service": SERVICE_NAME,
+            "env": ENV_NAME,
+            "window_minutes": window_minutes,
+            **series.to_columns(),
+        },
+        headers=headers,
     )
 
 
-@app.get("/logs", response_model=LogsResponse)
+@app.get("/metrics/cache")
+def get_metrics_cache():
+    """Hit/miss counters for the per-minute metric series cache."""
+    return time_series_cache_info()
+
+
+@app.get(
+    "/logs",
+    response_model=None,
+    responses={200: {"model": LogsResponse}},
+)
 def get_logs(
     count: int = Query(50, ge=10, le=500),
 ):
     """Synthetic logs for a single service (payment-api)."""
     now = datetime.now(timezone.utc)
     entries = generate_logs(now=now, count=count)
-    return LogsResponse(service=SERVICE_NAME, env=ENV_NAME, entries=entries)
+    return ORJSONResponse(
+        {"service": SERVICE_NAME, "env": ENV_NAME, "entries": entries}
+    )
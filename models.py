@@ -1,24 +1,50 @@
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
 from pydantic import BaseModel
-from typing import List
-import math
-import random
+from typing import List, Sequence, Tuple
 
-
-class MetricPoint(BaseModel):
-    timestamp: datetime
-    cpu_percent: float
-    memory_percent: float
-    latency_ms_p50: float
-    latency_ms_p95: float
-    error_rate_per_min: float
+import numpy as np
 
 
 class MetricsResponse(BaseModel):
+    """Metric samples as parallel columns; index ``i`` of each list is one step."""
+
     service: str
     env: str
     window_minutes: int
-    points: List[MetricPoint]
+    timestamps: List[datetime]
+    cpu_percent: List[float]
+    memory_percent: List[float]
+    latency_ms_p50: List[float]
+    latency_ms_p95: List[float]
+    error_rate_per_min: List[float]
+
+
+@dataclass(frozen=True)
+class MetricSeries:
+    """Column-oriented metric samples, kept as arrays up to the response."""
+
+    timestamps: Sequence[str]
+    cpu_percent: np.ndarray
+    memory_percent: np.ndarray
+    latency_ms_p50: np.ndarray
+    latency_ms_p95: np.ndarray
+    error_rate_per_min: np.ndarray
+
+    def to_columns(self) -> dict:
+        """Rounded columns for ``MetricsResponse``.
+
+        Values stay ndarrays; ``ORJSONResponse`` serializes them natively.
+        """
+        return {
+            "timestamps": self.timestamps,
+            "cpu_percent": self.cpu_percent.round(1),
+            "memory_percent": self.memory_percent.round(1),
+            "latency_ms_p50": self.latency_ms_p50.round(1),
+            "latency_ms_p95": self.latency_ms_p95.round(1),
+            "error_rate_per_min": self.error_rate_per_min.round(4),
+        }
 
 
 class LogEntry(BaseModel):
@@ -33,70 +59,137 @@ class LogsResponse(BaseModel):
     entries: List[LogEntry]
 
 
+# Shared by log generation; Generator serializes access to its bit generator.
+_RNG = np.random.default_rng()
+
+# Uniform noise bounds per column: cpu, mem, p50, p95 spread, error rate.
+_NOISE_LOW = np.array([-5.0, -7.0, -15.0, 80.0, 0.0])[:, None]
+_NOISE_HIGH = np.array([5.0, 7.0, 15.0, 200.0, 0.03])[:, None]
+
+
+@lru_cache(maxsize=256)
+def _cpu_pattern(total_steps: int) -> Tuple[np.ndarray, slice]:
+    """Noise-free CPU curve and incident-window bounds for a window length.
+
+    Both depend only on the number of steps, so they are computed once and
+    shared read-only between requests; callers add fresh noise on top.
+    """
+    frac = np.arange(total_steps) / total_steps
+    base_cpu = 50.0 + 25 * np.sin(frac * 2 * np.pi)
+    base_cpu.flags.writeable = False
+    in_window = np.flatnonzero((frac > 0.6) & (frac < 0.8))
+    if in_window.size:
+        incident = slice(int(in_window[0]), int(in_window[-1]) + 1)
+    else:
+        incident = slice(0, 0)
+    return base_cpu, incident
+
+
+def _iso_timestamps(end: datetime, offsets_s: np.ndarray, unit: str) -> np.ndarray:
+    """ISO-8601 UTC strings for ``end`` minus each offset, formatted in one pass."""
+    end64 = np.datetime64(end.astimezone(timezone.utc).replace(tzinfo=None), unit)
+    return np.datetime_as_string(
+        end64 - offsets_s.astype("timedelta64[s]"), unit=unit, timezone="UTC"
+    )
+
+
 def generate_time_series(
     *,
     now: datetime,
     window_minutes: int,
     step_seconds: int = 60,
-) -> List[MetricPoint]:
-    """Single synthetic pattern for one service (payment-api)."""
-    points: List[MetricPoint] = []
-    total_steps = int(window_minutes * 60 / step_seconds)
+) -> MetricSeries:
+    """Single synthetic pattern for one service (payment-api).
 
-    base_cpu = 50.0
-    base_mem = 60.0
+    The series is seeded from the request minute and window, so every poll
+    within the same minute gets the same samples, served from cache.
+    """
+    return _minute_time_series(
+        now.replace(second=0, microsecond=0), window_minutes, step_seconds
+    )
 
-    for i in range(total_steps):
-        t = now - timedelta(seconds=(total_steps - 1 - i) * step_seconds)
-        phase = i / total_steps * 2 * math.pi
 
-        cpu = base_cpu + 25 * math.sin(phase) + random.uniform(-5, 5)
-        if 0.6 < i / total_steps < 0.8:
-            cpu += random.uniform(10, 30)
-        cpu = max(1.0, min(cpu, 99.0))
+def time_series_cache_info() -> dict:
+    """Hit/miss counters for the per-minute metric series cache."""
+    return _minute_time_series.cache_info()._asdict()
 
-        mem = base_mem + random.uniform(-7, 7)
-        mem = max(5.0, min(mem, 95.0))
 
-        p50 = max(10, 40 + 2 * cpu + random.uniform(-15, 15))
-        p95 = p50 + random.uniform(80, 200)
+@lru_cache(maxsize=128)
+def _minute_time_series(
+    anchor: datetime, window_minutes: int, step_seconds: int
+) -> MetricSeries:
+    total_steps = int(window_minutes * 60 / step_seconds)
+    rng = np.random.default_rng(
+        [int(anchor.timestamp()), window_minutes, step_seconds]
+    )
 
-        error_rate = max(0.0, 0.01 * (cpu / 50.0) + random.uniform(0.0, 0.03))
+    base_cpu, incident = _cpu_pattern(total_steps)
+    base_mem = 60.0
 
-        points.append(
-            MetricPoint(
-                timestamp=t,
-                cpu_percent=round(cpu, 1),
-                memory_percent=round(mem, 1),
-                latency_ms_p50=round(p50, 1),
-                latency_ms_p95=round(p95, 1),
-                error_rate_per_min=round(error_rate, 4),
-            )
+    cpu_noise, mem_noise, p50_noise, p95_spread, error_noise = rng.uniform(
+        _NOISE_LOW, _NOISE_HIGH, (len(_NOISE_LOW), total_steps)
+    )
+
+    cpu = base_cpu + cpu_noise
+    cpu[incident] += rng.uniform(10, 30, incident.stop - incident.start)
+    cpu = np.clip(cpu, 1.0, 99.0)
+
+    mem = np.clip(base_mem + mem_noise, 5.0, 95.0)
+
+    p50 = np.maximum(10, 40 + 2 * cpu + p50_noise)
+    p95 = p50 + p95_spread
+
+    error_rate = np.maximum(0.0, 0.01 * (cpu / 50.0) + error_noise)
+
+    offsets = np.arange(total_steps - 1, -1, -1) * step_seconds
+    timestamps = tuple(_iso_timestamps(anchor, offsets, "s").tolist())
+
+    # Shared between requests through the cache, so freeze the columns.
+    for column in (cpu, mem, p50, p95, error_rate):
+        column.flags.writeable = False
+
+    return MetricSeries(
+        timestamps=timestamps,
+        cpu_percent=cpu,
+        memory_percent=mem,
+        latency_ms_p50=p50,
+        latency_ms_p95=p95,
+        error_rate_per_min=error_rate,
+    )
+
+
+_LOG_LEVELS = np.array(["INFO", "WARN", "ERROR"])
+# Cumulative level weights for normal traffic and for the escalated second half.
+_LOG_LEVEL_CDF = np.cumsum([0.6, 0.2, 0.2])
+_ESCALATED_LOG_LEVEL_CDF = np.cumsum([0.0, 1 / 3, 2 / 3])
+_LOG_MESSAGES = np.array([
+    "Handled request GET /health",
+    "Handled request POST /checkout",
+    "Cache miss for key session",
+    "Background job completed",
+    "Slow response from db-primary",
+    "Timeout talking to payment-gateway",
+    "High CPU detected on pod payment-api-01",
+    "Restarting container due to OOM",
+])
+
+
+def generate_logs(*, now: datetime, count: int = 50) -> List[dict]:
+    u = _RNG.random(count)
+    late = np.arange(count) > count * 0.5
+    level_idx = np.where(
+        late,
+        np.searchsorted(_ESCALATED_LOG_LEVEL_CDF, u, side="right"),
+        np.searchsorted(_LOG_LEVEL_CDF, u, side="right"),
+    )
+    chosen_levels = _LOG_LEVELS[level_idx]
+    messages = _LOG_MESSAGES[_RNG.integers(0, _LOG_MESSAGES.size, count)]
+
+    timestamps = _iso_timestamps(now, np.arange(count, 0, -1) * 15, "us")
+
+    return [
+        {"timestamp": ts, "level": level, "message": msg}
+        for ts, level, msg in zip(
+            timestamps.tolist(), chosen_levels.tolist(), messages.tolist()
         )
-
-    return points
-
-
-def generate_logs(*, now: datetime, count: int = 50):
-    levels = ["INFO", "INFO", "INFO", "WARN", "ERROR"]
-    base_msgs = [
-        "Handled request GET /health",
-        "Handled request POST /checkout",
-        "Cache miss for key session",
-        "Background job completed",
-        "Slow response from db-primary",
-        "Timeout talking to payment-gateway",
-        "High CPU detected on pod payment-api-01",
-        "Restarting container due to OOM",
     ]
-
-    entries: List[LogEntry] = []
-    for i in range(count):
-        ts = now - timedelta(seconds=(count - i) * 15)
-        level = random.choice(levels)
-        msg = random.choice(base_msgs)
-        if i > count * 0.5:
-            level = random.choice(["WARN", "ERROR", "ERROR"])
-        entries.append(LogEntry(timestamp=ts, level=level, message=msg))
-
-    return entries
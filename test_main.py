@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+NOW = datetime(2026, 1, 1, 12, 30, 15, tzinfo=timezone.utc)
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "datetime", _FixedDatetime)
+    return TestClient(main.app)
+
+
+def _etag(client):
+    response = client.get("/metrics?window_minutes=30")
+    assert response.status_code == 200
+    return response.headers["etag"]
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        "{etag}",
+        '{etag}, W/"x"',
+        'W/"x", {bare}',
+        "*",
+    ],
+)
+def test_metrics_not_modified(client, if_none_match):
+    etag = _etag(client)
+    header = if_none_match.format(etag=etag, bare=etag.removeprefix("W/"))
+    response = client.get(
+        "/metrics?window_minutes=30", headers={"If-None-Match": header}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_metrics_stale_etag(client):
+    etag = _etag(client)
+    response = client.get(
+        "/metrics?window_minutes=60", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["window_minutes"] == 60